@@ -5,6 +5,7 @@ Main module for the News Summarizer application.
 import os
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Set up logging
@@ -17,12 +18,6 @@ logging.basicConfig(
     ]
 )
 
-# Import application modules
-from src.scraper import NewsScraper
-from src.summarizer import ArticleSummarizer
-from src.file_manager import FileManager
-from src.console import ConsoleInterface
-
 def save_api_key(api_key):
     """Save the API key to the .env file."""
     try:
@@ -30,27 +25,50 @@ def save_api_key(api_key):
         env_path = os.path.abspath('.env')
         logging.info(f"Saving API key to {env_path}")
         
-        with open('.env', 'w') as f:
+        # Write to a temporary file and rename it into place so a partial .env is never left behind.
+        # Any failure to write raises and is handled below
+        tmp_path = env_path + ".tmp"
+        with open(tmp_path, 'w') as f:
             f.write(f"CLAUDE_API_KEY={api_key}")
-            
-        # Verify the key was saved correctly
-        if os.path.exists('.env'):
-            with open('.env', 'r') as f:
-                env_content = f.read()
-                # More secure verification that doesn't potentially expose the key in logs
-                if env_content.startswith("CLAUDE_API_KEY=") and len(env_content) > 15:
-                    logging.info("API key was saved successfully to .env file")
-                    return True
-                else:
-                    logging.warning("API key may not have been saved correctly to .env file")
-                    return False
-        else:
-            logging.error(".env file was not created")
-            return False
+        os.replace(tmp_path, env_path)
+        
+        logging.info("API key was saved successfully to .env file")
+        return True
     except Exception as e:
         logging.error(f"Failed to save API key: {str(e)}")
         return False
 
+# Number of articles shown per page, also the number of summaries prefetched at once
+ARTICLES_PER_PAGE = 10
+
+def generate_summary(summarizer, file_manager, article):
+    """Summarize an article and save the summary if it is valid."""
+    article_with_summary = summarizer.summarize(article)
+    
+    # Save to file only if there's a valid summary (not an error)
+    summary = article_with_summary.get('summary', '')
+    if 'summary' in article_with_summary and not summary.startswith('Error') and not summary.startswith('Cannot summarize:'):
+        file_path = file_manager.save_summary(article_with_summary)
+        if file_path:
+            logging.info(f"Summary saved to {file_path}")
+    else:
+        logging.warning(f"No valid summary generated for article: {article['title']}")
+    
+    return article_with_summary
+
+def prefetch_summaries(pool, prefetched, summarizer, file_manager, articles):
+    """Start background summarization for articles that have no saved summary yet."""
+    for article in articles:
+        if article['link'] in prefetched or file_manager.summary_exists(article)[0]:
+            continue
+        prefetched[article['link']] = pool.submit(generate_summary, summarizer, file_manager, article)
+
+def cancel_prefetches(prefetched):
+    """Cancel background summaries that haven't started yet, so they can be queued again later."""
+    for link, future in list(prefetched.items()):
+        if future.cancel():
+            del prefetched[link]
+
 def main():
     """Main function to run the news summarizer application."""
     # Check if .env file exists
@@ -75,6 +93,12 @@ def main():
     else:
         logging.warning("API key not found in environment")
     
+    # Import application modules here so their heavier dependencies load only when needed
+    from src.scraper import NewsScraper
+    from src.summarizer import ArticleSummarizer
+    from src.file_manager import FileManager
+    from src.console import ConsoleInterface
+    
     # Initialize components
     console = ConsoleInterface()
     file_manager = FileManager()
@@ -95,80 +119,110 @@ def main():
             else:
                 console.display_error("Failed to save API key.")
     
-    # Display welcome message
-    console.display_welcome()
+    # Summaries for the visible page are generated in the background while the user reads the list
+    prefetch_pool = ThreadPoolExecutor(max_workers=4)
+    prefetched = {}  # article link -> Future, also guards against duplicate jobs
     
-    # Main application loop
-    running = True
-    while running:
-        console.display_header()
-        
-        # Main menu
-        main_options = [
-            "Browse Canada News",
-            "Browse US News",
-            "Browse World News",
-            "Exit"
-        ]
-        
-        main_choice = console.display_menu(main_options)
+    # Articles already loaded this session, keyed by category; cleared by "Refresh News"
+    feeds = {}
+    
+    try:
+        # Display welcome message
+        console.display_welcome()
         
-        if main_choice == 3:  # Exit
-            if console.confirm_exit():
-                running = False
-                console.display_success("Thank you for using 3eekeeper News Summarizer!")
-                continue
-            else:
+        # Main application loop
+        running = True
+        while running:
+            console.display_header()
+            
+            # Main menu
+            main_options = [
+                "Browse Canada News",
+                "Browse US News",
+                "Browse World News",
+                "Refresh News",
+                "Exit"
+            ]
+            
+            main_choice = console.display_menu(main_options)
+            
+            if main_choice == 3:  # Refresh
+                feeds.clear()
+                file_manager.clear_cached_feeds()
+                console.display_success("News will be fetched again on your next selection.")
                 continue
-        
-        # Map menu choice to category
-        categories = ["canada", "us", "world"]
-        selected_category = categories[main_choice]
-        
-        # Fetch articles for the selected category
-        console.display_loading(f"Fetching {selected_category.capitalize()} news... ")
-        articles = scraper.get_feed(selected_category)
-        console.finish_loading(f"Found {len(articles)} articles.")
-        
-        # Display articles
-        page = 0
-        browsing_articles = True
-        
-        while browsing_articles:
-            article_choice = console.display_articles(articles, page)
             
-            if article_choice == -1:  # Previous page
-                page = max(0, page - 1)
-            elif article_choice == -2:  # Next page
-                page = page + 1
-            elif article_choice == -3:  # Back to main menu
-                browsing_articles = False
-            else:  # Selected an article
-                selected_article = articles[article_choice]
+            if main_choice == 4:  # Exit
+                if console.confirm_exit():
+                    running = False
+                    console.display_success("Thank you for using 3eekeeper News Summarizer!")
+                    continue
+                else:
+                    continue
+            
+            # Map menu choice to category
+            categories = ["canada", "us", "world"]
+            selected_category = categories[main_choice]
+            
+            # Fetch articles for the selected category
+            console.display_loading(f"Fetching {selected_category.capitalize()} news... ")
+            articles = feeds.get(selected_category)
+            if articles is None:
+                articles = file_manager.get_cached_feed(selected_category)
+                if articles is None:
+                    articles = scraper.get_feed(selected_category)
+                    if articles:
+                        file_manager.save_cached_feed(selected_category, articles)
+                if articles:
+                    feeds[selected_category] = articles
+            console.finish_loading(f"Found {len(articles)} articles.")
+            
+            # Display articles
+            page = 0
+            browsing_articles = True
+            
+            while browsing_articles:
+                if summarizer.is_api_key_set():
+                    page_articles = articles[page * ARTICLES_PER_PAGE:(page + 1) * ARTICLES_PER_PAGE]
+                    prefetch_summaries(prefetch_pool, prefetched, summarizer, file_manager, page_articles)
+                article_choice = console.display_articles(articles, page, ARTICLES_PER_PAGE)
                 
-                # Check if summary already exists
-                existing_summary = file_manager.get_summary(selected_article)
+                if article_choice < 0:
+                    # Leaving this page; don't spend API calls on articles no longer shown
+                    cancel_prefetches(prefetched)
                 
-                if existing_summary:
-                    # Display existing summary
-                    console.display_summary(existing_summary)
-                else:
-                    # Generate and save summary
-                    console.display_loading("Generating summary... ")
-                    article_with_summary = summarizer.summarize(selected_article)
-                    console.finish_loading("Summary generated!")
+                if article_choice == -1:  # Previous page
+                    page = max(0, page - 1)
+                elif article_choice == -2:  # Next page
+                    page = page + 1
+                elif article_choice == -3:  # Back to main menu
+                    browsing_articles = False
+                else:  # Selected an article
+                    selected_article = articles[article_choice]
                     
-                    # Save to file only if there's a valid summary (not an error)
-                    summary = article_with_summary.get('summary', '')
-                    if 'summary' in article_with_summary and not summary.startswith('Error') and not summary.startswith('Cannot summarize:'):
-                        file_path = file_manager.save_summary(article_with_summary)
-                        if file_path:
-                            logging.info(f"Summary saved to {file_path}")
-                    else:
-                        logging.warning(f"No valid summary generated for article: {selected_article['title']}")
+                    # Check if summary already exists
+                    existing_summary = file_manager.get_summary(selected_article)
                     
-                    # Display summary
-                    console.display_summary(article_with_summary)
+                    if existing_summary:
+                        # Display existing summary
+                        console.display_summary(existing_summary)
+                    else:
+                        # Use the prefetched summary if it's already underway, otherwise generate it now
+                        # rather than waiting behind the jobs queued before it
+                        console.display_loading("Generating summary... ")
+                        future = prefetched.pop(selected_article['link'], None)
+                        if future is not None and not future.cancel():
+                            article_with_summary = future.result()
+                        else:
+                            article_with_summary = generate_summary(summarizer, file_manager, selected_article)
+                        console.finish_loading("Summary generated!")
+                        
+                        # Display summary
+                        console.display_summary(article_with_summary)
+    finally:
+        # Drop any summaries still queued in the background, also when interrupted
+        cancel_prefetches(prefetched)
+        prefetch_pool.shutdown(wait=False)
 
 if __name__ == "__main__":
     try:
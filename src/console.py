@@ -5,6 +5,7 @@ import os
 import sys
 import time
 import logging
+import textwrap
 from colorama import Fore, Back, Style, init
 
 # Initialize colorama
@@ -32,21 +33,69 @@ class ConsoleInterface:
         
         # Screen dimensions
         self.width = 80
+        
+        # Clear with an escape sequence instead of spawning a shell when attached to a terminal
+        self._ansi_clear = sys.stdout.isatty()
+        
+        # Separator lines and box edges, constant for the lifetime of the interface
+        self._box_top = "╔" + "═" * (self.width - 2) + "╗"
+        self._box_bottom = "╚" + "═" * (self.width - 2) + "╝"
+        self._hline = self.colors['separator'] + "─" * self.width
+        self._eqline = self.colors['separator'] + "═" * self.width
+        self._paragraph_rule = self.colors['separator'] + "─" * (self.width - 15)
+        
+        # Static screen blocks, built once and emitted with a single write
+        self._header_str = self._join_lines([
+            self.colors['title'] + self._box_top,
+            self.colors['title'] + "║" + " " * (self.width - 2) + "║",
+            self.colors['title'] + "║" + " 3EEKEEPER NEWS SUMMARIZER ".center(self.width - 2) + "║",
+            self.colors['title'] + "║" + " Powered by Claude 3 Haiku ".center(self.width - 2) + "║",
+            self.colors['title'] + "║" + " " * (self.width - 2) + "║",
+            self.colors['title'] + self._box_bottom,
+            "",
+        ])
+        self._welcome_str = self._join_lines([
+            self.colors['menu_header'] + "Welcome to the 3eekeeper News Summarizer!",
+            "",
+            "This application allows you to browse and summarize news articles from various sources.",
+            "Articles are summarized using Claude 3 Haiku when you first view them.",
+            "Summaries are saved locally for faster access in the future.",
+            "",
+            self.colors['highlight'] + "How to use:",
+            "1. Select a news category (Canada, US, or World)",
+            "2. Browse the list of articles",
+            "3. Select an article to see its summary",
+            "4. Follow the link to read the full article if interested",
+            "",
+        ])
+        self._summary_box_str = self._join_lines([
+            self.colors['menu_header'] + self._box_top,
+            self.colors['menu_header'] + "║" + " SUMMARY ".center(self.width - 2) + "║",
+            self.colors['menu_header'] + self._box_bottom,
+            "",
+        ])
+    
+    def _join_lines(self, lines):
+        """Join lines into one block, resetting the style at the end of each line like print() does."""
+        return "".join(line + Style.RESET_ALL + "\n" for line in lines)
+    
+    def _write(self, text):
+        """Write text to stdout in a single call and flush it."""
+        sys.stdout.write(text)
+        sys.stdout.flush()
     
     def clear_screen(self):
         """Clear the console screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self._ansi_clear:
+            # Cursor home + erase display; colorama translates this on Windows
+            self._write("\x1b[H\x1b[2J")
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
     
     def display_header(self):
         """Display the application header."""
         self.clear_screen()
-        print(self.colors['title'] + "╔" + "═" * (self.width - 2) + "╗")
-        print(self.colors['title'] + "║" + " " * (self.width - 2) + "║")
-        print(self.colors['title'] + "║" + " 3EEKEEPER NEWS SUMMARIZER ".center(self.width - 2) + "║")
-        print(self.colors['title'] + "║" + " Powered by Claude 3 Haiku ".center(self.width - 2) + "║")
-        print(self.colors['title'] + "║" + " " * (self.width - 2) + "║")
-        print(self.colors['title'] + "╚" + "═" * (self.width - 2) + "╝")
-        print()
+        self._write(self._header_str)
     
     def display_menu(self, options):
         """
@@ -103,16 +152,20 @@ class ConsoleInterface:
             input(self.colors['prompt'] + "Press Enter to return to the main menu...")
             return -3
         
-        print(self.colors['menu_header'] + f"Articles - Page {page + 1} of {total_pages}")
-        print(self.colors['separator'] + "─" * self.width)
+        # Build the whole page and write it in one call
+        lines = [
+            self.colors['menu_header'] + f"Articles - Page {page + 1} of {total_pages}",
+            self._hline,
+        ]
         
         for i, article in enumerate(articles[start_idx:end_idx], 1):
-            print(f"{self.colors['menu_item']}{i}. {article['title']}")
-            print(f"   {self.colors['info']}{article['source']} - {article.get('date', 'No date')}")
-            print(f"   {self.colors['info']}{article.get('description', '')}")
-            print(self.colors['separator'] + "─" * self.width)
+            lines.append(f"{self.colors['menu_item']}{i}. {article['title']}")
+            lines.append(f"   {self.colors['info']}{article['source']} - {article.get('date', 'No date')}")
+            lines.append(f"   {self.colors['info']}{article.get('description', '')}")
+            lines.append(self._hline)
         
-        print()
+        lines.append("")
+        self._write(self._join_lines(lines))
         options = []
         
         if page > 0:
@@ -172,9 +225,9 @@ class ConsoleInterface:
             return
         
         # Display article metadata with improved spacing and formatting
-        print(self.colors['highlight'] + "╔" + "═" * (self.width - 2) + "╗")
+        print(self.colors['highlight'] + self._box_top)
         print(self.colors['highlight'] + "║" + article_with_summary['title'].center(self.width - 2) + "║")
-        print(self.colors['highlight'] + "╚" + "═" * (self.width - 2) + "╝")
+        print(self.colors['highlight'] + self._box_bottom)
         print()
         print(self.colors['info'] + f"Source: {article_with_summary['source']}")
         print(self.colors['info'] + f"Date: {article_with_summary.get('date', 'No date')}")
@@ -182,10 +235,7 @@ class ConsoleInterface:
         print()
         
         # Display summary with improved formatting
-        print(self.colors['menu_header'] + "╔" + "═" * (self.width - 2) + "╗")
-        print(self.colors['menu_header'] + "║" + " SUMMARY ".center(self.width - 2) + "║")
-        print(self.colors['menu_header'] + "╚" + "═" * (self.width - 2) + "╝")
-        print()
+        self._write(self._summary_box_str)
         
         # Process the summary text
         summary = article_with_summary['summary']
@@ -213,37 +263,29 @@ class ConsoleInterface:
                     # Remove the introductory text
                     text = text.split(":", 1)[1].strip() if ":" in text else text
                 # If we just have one paragraph, try to identify logical breaks
+                # Collect sentences and join each paragraph once instead of growing a string
                 paragraphs = []
-                current_paragraph = ""
+                sentences = []
+                length = 0
                 for sentence in text.split('. '):
-                    if len(current_paragraph) > 250:  # arbitrary length for paragraph break
-                        paragraphs.append(current_paragraph.strip() + '.')
-                        current_paragraph = sentence
-                    else:
-                        current_paragraph += '. ' + sentence if current_paragraph else sentence
-                if current_paragraph:
-                    paragraphs.append(current_paragraph.strip())
+                    if length > 250:  # arbitrary length for paragraph break
+                        paragraphs.append('. '.join(sentences).strip() + '.')
+                        sentences = []
+                        length = 0
+                    if sentence or sentences:
+                        length += len(sentence) + (2 if sentences else 0)
+                        sentences.append(sentence)
+                if sentences:
+                    paragraphs.append('. '.join(sentences).strip())
         
         # Display each paragraph with wrapping, spacing, and numbering
         for i, paragraph in enumerate(paragraphs, 1):
             # Display paragraph number and divider
-            print(f"{self.colors['menu_header']}■ Paragraph {i} {self.colors['separator']}" + "─" * (self.width - 15))
+            print(f"{self.colors['menu_header']}■ Paragraph {i} {self._paragraph_rule}")
             print()
             
             # Word wrap the paragraph
-            words = paragraph.split()
-            lines = []
-            current_line = ""
-            
-            for word in words:
-                if len(current_line) + len(word) + 1 <= self.width:
-                    current_line += " " + word if current_line else word
-                else:
-                    lines.append(current_line)
-                    current_line = word
-            
-            if current_line:
-                lines.append(current_line)
+            lines = textwrap.wrap(paragraph, width=self.width, break_long_words=False, break_on_hyphens=False)
             
             # Print lines with a slight indent
             for line in lines:
@@ -253,10 +295,10 @@ class ConsoleInterface:
             print()
             print()
         
-        print(self.colors['separator'] + "═" * self.width)
+        print(self._eqline)
         currentTime = time.strftime("%Y-%m-%d %H:%M:%S")
         print(f"{self.colors['info']}Summarized using Claude 3 Haiku on {currentTime}")
-        print(self.colors['separator'] + "═" * self.width)
+        print(self._eqline)
         print()
         input(self.colors['prompt'] + "Press Enter to return...")
     
@@ -277,7 +319,8 @@ class ConsoleInterface:
         Args:
             message (str): The loading message to display
         """
-        print(self.colors['info'] + message, end='', flush=True)
+        # Flushed immediately since a blocking call usually follows
+        self._write(self.colors['info'] + message)
     
     def update_loading(self, message=""):
         """
@@ -286,7 +329,8 @@ class ConsoleInterface:
         Args:
             message (str): The loading message to display
         """
-        print(self.colors['info'] + message, end='', flush=True)
+        # Left buffered until the next flush
+        sys.stdout.write(self.colors['info'] + message)
     
     def finish_loading(self, message="Done!"):
         """
@@ -295,7 +339,7 @@ class ConsoleInterface:
         Args:
             message (str): The completion message to display
         """
-        print(self.colors['success'] + message)
+        self._write(self.colors['success'] + message + "\n")
         time.sleep(0.5)
     
     def display_success(self, message):
@@ -311,18 +355,7 @@ class ConsoleInterface:
     def display_welcome(self):
         """Display a welcome message and basic instructions."""
         self.display_header()
-        print(self.colors['menu_header'] + "Welcome to the 3eekeeper News Summarizer!")
-        print()
-        print("This application allows you to browse and summarize news articles from various sources.")
-        print("Articles are summarized using Claude 3 Haiku when you first view them.")
-        print("Summaries are saved locally for faster access in the future.")
-        print()
-        print(self.colors['highlight'] + "How to use:")
-        print("1. Select a news category (Canada, US, or World)")
-        print("2. Browse the list of articles")
-        print("3. Select an article to see its summary")
-        print("4. Follow the link to read the full article if interested")
-        print()
+        self._write(self._welcome_str)
         input(self.colors['prompt'] + "Press Enter to continue...")
     
     def confirm_exit(self):
@@ -3,25 +3,106 @@ Module for managing summary files.
 """
 import os
 import re
+import json
+import time
 import logging
 from datetime import datetime
 import hashlib
+import heapq
+
+# Patterns used to turn article titles into filenames
+UNSAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+WHITESPACE_RE = re.compile(r'[\s]+')
+
+# Fixed-width first line of a summary file: byte offset and length of the summary body
+OFFSET_HEADER = "OFF={:010d},{:010d}\n"
+OFFSET_HEADER_LEN = len(OFFSET_HEADER.format(0, 0))
 
 class FileManager:
     """Class to handle file operations for news summaries."""
     
-    def __init__(self, summaries_dir="summaries"):
+    def __init__(self, summaries_dir="summaries", feed_cache_dir="feed_cache"):
         """
         Initialize the FileManager with summaries directory.
         
         Args:
             summaries_dir (str): Path to the summaries directory
+            feed_cache_dir (str): Path to the directory for cached news feeds
         """
         self.summaries_dir = summaries_dir
+        self.feed_cache_dir = feed_cache_dir
+        
+        # Create the summaries and feed cache directories if they don't exist
+        os.makedirs(self.summaries_dir, exist_ok=True)
+        os.makedirs(self.feed_cache_dir, exist_ok=True)
+        
+        # Index of url_hash -> filename, built once instead of listing the directory per lookup
+        self._hash_index = {}
+        # Whether lookups may need the md5-based names written by older versions
+        self._legacy_lookup = False
+        self.refresh_index()
+    
+    def refresh_index(self):
+        """
+        Rebuild the in-memory index of existing summary files.
+        
+        Call this if the summaries directory is modified outside of this class.
+        """
+        index = {}
+        with os.scandir(self.summaries_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                # Filenames always end in _<8-char hash>.txt
+                if len(name) < 13 or name[-13] != '_' or not name.endswith('.txt'):
+                    continue
+                index[name[-12:-4]] = name
+        self._hash_index = index
+        # Files saved from now on are indexed by their new hash, so only files found here can be legacy
+        self._legacy_lookup = bool(index)
+    
+    def _url_hash(self, article):
+        """
+        Get the short URL hash for an article, caching it on the article dict.
         
-        # Create the summaries directory if it doesn't exist
-        if not os.path.exists(self.summaries_dir):
-            os.makedirs(self.summaries_dir)
+        Args:
+            article (dict): Article data including link
+            
+        Returns:
+            str: An 8-character hash of the article URL
+        """
+        url_hash = article.get('_url_hash')
+        if url_hash is None:
+            url_hash = hashlib.blake2b(article['link'].encode(), digest_size=4).hexdigest()
+            article['_url_hash'] = url_hash
+        return url_hash
+    
+    def _legacy_url_hash(self, article):
+        """
+        Get the md5-based URL hash used in filenames written by older versions.
+        
+        Args:
+            article (dict): Article data including link
+            
+        Returns:
+            str or None: An 8-character hash of the article URL, or None if md5 is unavailable
+        """
+        legacy_hash = article.get('_legacy_url_hash')
+        if legacy_hash is None:
+            data = article['link'].encode()
+            try:
+                try:
+                    digest = hashlib.md5(data, usedforsecurity=False)
+                except TypeError:
+                    # Python < 3.9 has no usedforsecurity flag
+                    digest = hashlib.md5(data)
+            except ValueError:
+                # md5 is blocked on FIPS-enabled systems; stop looking for legacy files
+                logging.warning("md5 is unavailable, summaries saved by older versions won't be found")
+                self._legacy_lookup = False
+                return None
+            legacy_hash = digest.hexdigest()[:8]
+            article['_legacy_url_hash'] = legacy_hash
+        return legacy_hash
     
     def generate_filename(self, article):
         """
@@ -34,11 +115,11 @@ class FileManager:
             str: A unique filename for the article
         """
         # Generate a unique hash from the article URL
-        url_hash = hashlib.md5(article['link'].encode()).hexdigest()[:8]
+        url_hash = self._url_hash(article)
         
         # Clean the title to make it filename-friendly
-        title = re.sub(r'[^\w\s-]', '', article['title'])
-        title = re.sub(r'[\s]+', '_', title).strip().lower()
+        title = UNSAFE_CHARS_RE.sub('', article['title'])
+        title = WHITESPACE_RE.sub('_', title).strip().lower()
         title = title[:50]  # Limit title length in filename
         
         # Format the date part
@@ -59,16 +140,18 @@ class FileManager:
         Returns:
             tuple: (bool indicating if summary exists, filename if it exists)
         """
-        # Get all summary filenames
-        all_files = os.listdir(self.summaries_dir)
-        
         # Generate URL hash for the article
-        url_hash = hashlib.md5(article['link'].encode()).hexdigest()[:8]
+        url_hash = self._url_hash(article)
         
-        # Check if any filename contains this hash
-        for filename in all_files:
-            if url_hash in filename and filename.endswith('.txt'):
-                return True, filename
+        # Look the hash up in the index of existing summary files
+        filename = self._hash_index.get(url_hash)
+        if filename is None and self._legacy_lookup:
+            # Summaries saved by older versions are named with an md5-based hash
+            legacy_hash = self._legacy_url_hash(article)
+            if legacy_hash is not None:
+                filename = self._hash_index.get(legacy_hash)
+        if filename is not None:
+            return True, filename
         
         return False, self.generate_filename(article)
     
@@ -91,18 +174,33 @@ class FileManager:
         filepath = os.path.join(self.summaries_dir, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                # Write a nicely formatted summary file
-                f.write(f"Title: {article_with_summary['title']}\n")
-                f.write(f"Source: {article_with_summary['source']}\n")
-                f.write(f"Date: {article_with_summary.get('date', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))}\n")
-                f.write(f"URL: {article_with_summary['link']}\n")
-                f.write("\n" + "="*50 + "\n\n")
-                f.write("SUMMARY:\n\n")
-                f.write(article_with_summary['summary'])
-                f.write("\n\n" + "="*50 + "\n")
-                f.write("\nSummarized using Claude 3 Haiku on ")
-                f.write(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            # Build a nicely formatted summary file
+            preamble = (
+                f"Title: {article_with_summary['title']}\n"
+                f"Source: {article_with_summary['source']}\n"
+                f"Date: {article_with_summary.get('date', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))}\n"
+                f"URL: {article_with_summary['link']}\n"
+                "\n" + "="*50 + "\n\n"
+                "SUMMARY:\n\n"
+            ).encode('utf-8')
+            body = article_with_summary['summary'].encode('utf-8')
+            footer = (
+                "\n\n" + "="*50 + "\n"
+                "\nSummarized using Claude 3 Haiku on "
+                + datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            ).encode('utf-8')
+            
+            # Record where the summary body lives so get_summary can seek straight to it
+            header = OFFSET_HEADER.format(OFFSET_HEADER_LEN + len(preamble), len(body)).encode('ascii')
+            
+            # Write to a temporary file and rename so a partial file is never left behind
+            tmp_path = filepath + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(header + preamble + body + footer)
+            os.replace(tmp_path, filepath)
+            
+            # Keep the index in sync with the new file
+            self._hash_index[self._url_hash(article_with_summary)] = filename
             
             logging.info(f"Summary saved: {filename}")
             return filepath
@@ -129,15 +227,25 @@ class FileManager:
         filepath = os.path.join(self.summaries_dir, filename)
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(filepath, 'rb') as f:
+                header = f.read(OFFSET_HEADER_LEN)
+                
+                if header.startswith(b'OFF='):
+                    # Jump directly to the summary body using the offset header
+                    offset, length = (int(value) for value in header[4:].split(b','))
+                    f.seek(offset)
+                    summary = f.read(length).decode('utf-8').strip()
+                    return {**article, 'summary': summary}
+                
+                # Legacy files without an offset header, possibly written with Windows line endings
+                content = (header + f.read()).decode('utf-8').replace('\r\n', '\n')
                 
                 # Extract the summary part between the markers
-                summary_match = re.search(r'SUMMARY:\n\n(.*?)(?:\n\n={50})', content, re.DOTALL)
+                _, _, rest = content.partition("SUMMARY:\n\n")
+                summary, end_marker, _ = rest.partition("\n\n" + "="*50)
                 
-                if summary_match:
-                    summary = summary_match.group(1).strip()
-                    return {**article, 'summary': summary}
+                if end_marker:
+                    return {**article, 'summary': summary.strip()}
                 else:
                     return None
                     
@@ -156,16 +264,69 @@ class FileManager:
             list: List of summary filenames sorted by date
         """
         try:
-            all_files = os.listdir(self.summaries_dir)
-            
-            # Filter for .txt files
-            summary_files = [f for f in all_files if f.endswith('.txt')]
+            with os.scandir(self.summaries_dir) as entries:
+                # Filter for .txt files
+                summary_files = (entry.name for entry in entries if entry.name.endswith('.txt'))
+                
+                # Keep the newest by date (assuming filename starts with date in format YYYYMMDD)
+                return heapq.nlargest(limit, summary_files)
             
-            # Sort by date (assuming filename starts with date in format YYYYMMDD)
-            sorted_files = sorted(summary_files, reverse=True)
+        except Exception as e:
+            logging.error(f"Error listing summaries: {str(e)}")
+            return []
+    
+    def get_cached_feed(self, category, ttl=300):
+        """
+        Retrieve cached articles for a category if the cache is still fresh.
+        
+        Args:
+            category (str): News category
+            ttl (int): Maximum age of the cache in seconds
             
-            return sorted_files[:limit]
+        Returns:
+            list or None: Cached list of articles, or None if missing or expired
+        """
+        filepath = os.path.join(self.feed_cache_dir, f"{category}.json")
+        
+        try:
+            if time.time() - os.path.getmtime(filepath) >= ttl:
+                return None
             
+            with open(filepath, 'r', encoding='utf-8') as f:
+                return json.load(f)
+                
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logging.error(f"Error listing summaries: {str(e)}")
-            return []
\ No newline at end of file
+            logging.error(f"Error reading cached feed: {str(e)}")
+            return None
+    
+    def save_cached_feed(self, category, articles):
+        """
+        Cache the articles fetched for a category.
+        
+        Args:
+            category (str): News category
+            articles (list): List of article dictionaries
+        """
+        filepath = os.path.join(self.feed_cache_dir, f"{category}.json")
+        
+        try:
+            tmp_path = filepath + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(articles, f)
+            os.replace(tmp_path, filepath)
+                
+        except Exception as e:
+            logging.error(f"Error caching feed: {str(e)}")
+    
+    def clear_cached_feeds(self):
+        """Remove all cached feeds so the next request fetches fresh articles."""
+        try:
+            with os.scandir(self.feed_cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json'):
+                        os.remove(entry.path)
+                        
+        except Exception as e:
+            logging.error(f"Error clearing cached feeds: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""
+Module for creating pooled HTTP sessions shared by the scraper and summarizer.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+def create_session(headers=None):
+    """
+    Create a requests Session that keeps connections alive and retries transient errors.
+    
+    Args:
+        headers (dict, optional): Default headers to send with every request
+        
+    Returns:
+        requests.Session: The configured session
+    """
+    session = requests.Session()
+    
+    # Reuse TCP/TLS connections and retry idempotent requests on transient failures
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    
+    if headers:
+        session.headers.update(headers)
+    
+    return session
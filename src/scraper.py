@@ -3,10 +3,55 @@ Module for scraping news feeds from various sources.
 """
 import requests
 import logging
+import html
+import re
+import threading
+import time
+from urllib.parse import urlparse
 from bs4 import BeautifulSoup
-import xml.etree.ElementTree as ET
+from lxml import etree as ET
 from datetime import datetime
-import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from src.http_session import create_session
+
+# Matches a single HTML tag in a feed description
+TAG_RE = re.compile(r'<[^>]+>')
+
+# Date formats commonly found in RSS feeds, tried when the fast paths don't match
+DATE_FORMATS = (
+    '%a, %d %b %Y %H:%M:%S %z',  # RFC 822: Wed, 02 Oct 2002 13:00:00 GMT
+    '%a, %d %b %Y %H:%M:%S %Z',  # Wed, 02 Oct 2002 13:00:00 GMT
+    '%Y-%m-%dT%H:%M:%S%z',       # ISO 8601: 2002-10-02T13:00:00Z
+    '%Y-%m-%dT%H:%M:%SZ',        # 2002-10-02T13:00:00Z
+    '%Y-%m-%d %H:%M:%S',         # 2002-10-02 13:00:00
+    '%Y-%m-%d',                  # 2002-10-02
+)
+
+@lru_cache(maxsize=4096)
+def _format_date(date_str):
+    """Convert a feed date string into the standard format, or return it unchanged."""
+    # Most RSS feeds use RFC 822 dates
+    try:
+        return parsedate_to_datetime(date_str).strftime('%Y-%m-%d %H:%M:%S')
+    except (TypeError, ValueError, IndexError):
+        pass
+    
+    # Atom feeds use ISO 8601 dates
+    try:
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        pass
+    
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).strftime('%Y-%m-%d %H:%M:%S')
+        except ValueError:
+            continue
+    
+    # If none of the formats match, return the original string
+    return date_str
 
 class NewsScraper:
     """Class to handle scraping news from various RSS feeds."""
@@ -31,10 +76,23 @@ class NewsScraper:
                 {"name": "Al Jazeera", "url": "https://www.aljazeera.com/xml/rss/all.xml"}
             ]
         }
+        
+        # Source lookups resolved once, since the source list never changes
+        self._sources_flat = {category: tuple(sources) for category, sources in self.sources.items()}
+        self._source_names = {category: tuple(source["name"] for source in sources) for category, sources in self.sources.items()}
+        
         self.timeout = 10  # Request timeout in seconds
+        self.host_interval = 0.5  # Minimum seconds between requests to the same host
+        self._last_hit = {}  # host -> time of the latest scheduled request
+        self._host_lock = threading.Lock()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self.session = create_session(self.headers)
+        
+        # Worker threads live as long as the scraper so each keeps its own reusable XML parser
+        self._fetch_pool = ThreadPoolExecutor(max_workers=max(len(sources) for sources in self.sources.values()))
+        self._parsers = threading.local()
     
     def get_feed(self, category, source_index=None):
         """
@@ -47,130 +105,164 @@ class NewsScraper:
         Returns:
             list: List of articles with title, description, link, and source
         """
-        if category not in self.sources:
+        sources = self._sources_flat.get(category)
+        if sources is None:
             logging.error(f"Invalid category: {category}")
             return []
         
         articles = []
-        sources_to_fetch = [self.sources[category][source_index]] if source_index is not None else self.sources[category]
+        sources_to_fetch = (sources[source_index],) if source_index is not None else sources
         
-        for source in sources_to_fetch:
-            try:
-                response = requests.get(source["url"], headers=self.headers, timeout=self.timeout)
+        # Fetch all sources concurrently; results come back in source order
+        for feed_articles in self._fetch_pool.map(self._fetch_source, sources_to_fetch):
+            articles.extend(feed_articles)
+        
+        return articles
+    
+    def _fetch_source(self, source):
+        """
+        Fetch and parse a single news source.
+        
+        Args:
+            source (dict): Source with name and url
+            
+        Returns:
+            list: List of article dictionaries, empty if the fetch failed
+        """
+        try:
+            # Be respectful to servers without delaying requests to other hosts
+            self._wait_for_host(source["url"])
+            with self.session.get(source["url"], timeout=self.timeout, stream=True) as response:
                 response.raise_for_status()
                 
-                # Parse the RSS feed
-                feed_articles = self._parse_rss(response.content, source["name"])
-                articles.extend(feed_articles)
-                
-                # Add a small delay to be respectful to the servers
-                time.sleep(0.5)
-                
-            except requests.RequestException as e:
-                logging.error(f"Error fetching {source['name']}: {str(e)}")
-                continue
+                # Parse the RSS feed while it downloads
+                return self._parse_rss_stream(response, source["name"])
+            
+        except requests.RequestException as e:
+            logging.error(f"Error fetching {source['name']}: {str(e)}")
+            return []
+    
+    def _wait_for_host(self, url):
+        """Sleep until at least host_interval seconds have passed since the last request to this URL's host."""
+        host = urlparse(url).netloc
         
-        return articles
+        # Reserve the next free slot for this host under the lock, then sleep outside it
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._last_hit.get(host, 0.0) + self.host_interval)
+            self._last_hit[host] = slot
+        
+        if slot > now:
+            time.sleep(slot - now)
     
-    def _parse_rss(self, content, source_name):
+    def _xml_parser(self):
+        """Get this thread's feed parser, creating it on first use since lxml parsers aren't thread-safe."""
+        parser = getattr(self._parsers, 'xml', None)
+        if parser is None:
+            # Recover from minor markup errors instead of dropping the whole feed
+            parser = ET.XMLPullParser(events=('end',), tag=('item', '{*}entry'),
+                                      recover=True, resolve_entities=False, huge_tree=False)
+            self._parsers.xml = parser
+        return parser
+    
+    def _parse_rss_stream(self, response, source_name):
         """
-        Parse RSS content into a list of articles.
+        Parse a streamed RSS or Atom response item by item.
+        
+        Each item is discarded once it has been read, so memory use stays at
+        roughly one item rather than the whole feed.
         
         Args:
-            content (bytes): RSS feed content
+            response (requests.Response): Streamed feed response
             source_name (str): Name of the news source
             
         Returns:
             list: List of article dictionaries
         """
+        parser = self._xml_parser()
         articles = []
+        completed = False
         
         try:
-            # First try to parse as XML using ElementTree
-            root = ET.fromstring(content)
-            
-            # Handle different RSS formats
-            if root.tag == 'rss':
-                # Standard RSS format
-                for item in root.findall('.//item'):
-                    article = {
-                        'title': self._safe_find_text(item, 'title'),
-                        'description': self._clean_description(self._safe_find_text(item, 'description')),
-                        'link': self._safe_find_text(item, 'link'),
-                        'date': self._parse_date(self._safe_find_text(item, 'pubDate')),
-                        'source': source_name
-                    }
-                    articles.append(article)
-            elif root.tag.endswith('feed'):
-                # Atom feed format
-                for entry in root.findall('.//{*}entry'):
-                    link = entry.find('.//{*}link')
-                    article = {
-                        'title': self._safe_find_text(entry, '{*}title'),
-                        'description': self._clean_description(self._safe_find_text(entry, '{*}summary')),
-                        'link': link.get('href') if link is not None else '',
-                        'date': self._parse_date(self._safe_find_text(entry, '{*}updated')),
-                        'source': source_name
-                    }
-                    articles.append(article)
+            # iter_content decompresses the body and raises requests exceptions on network errors
+            for chunk in response.iter_content(chunk_size=16384):
+                parser.feed(chunk)
+                self._read_items(parser, articles, source_name)
+            parser.close()
+            self._read_items(parser, articles, source_name)
+            completed = True
                     
-        except ET.ParseError:
-            # If XML parsing fails, try with BeautifulSoup
-            try:
-                soup = BeautifulSoup(content, 'xml')
-                
-                # Try standard RSS format first
-                items = soup.find_all('item')
-                if items:
-                    for item in items:
-                        article = {
-                            'title': item.title.text if item.title else 'No title',
-                            'description': self._clean_description(item.description.text if item.description else ''),
-                            'link': item.link.text if item.link else '',
-                            'date': self._parse_date(item.pubDate.text if item.pubDate else ''),
-                            'source': source_name
-                        }
-                        articles.append(article)
-                else:
-                    # Try Atom format
-                    entries = soup.find_all('entry')
-                    for entry in entries:
-                        link_tag = entry.find('link')
-                        link = link_tag.get('href') if link_tag else ''
-                        
-                        article = {
-                            'title': entry.title.text if entry.title else 'No title',
-                            'description': self._clean_description(
-                                entry.summary.text if entry.summary else (
-                                entry.content.text if entry.content else '')
-                            ),
-                            'link': link,
-                            'date': self._parse_date(
-                                entry.updated.text if entry.updated else (
-                                entry.published.text if entry.published else '')
-                            ),
-                            'source': source_name
-                        }
-                        articles.append(article)
-            
-            except Exception as e:
-                logging.error(f"Error parsing feed content for {source_name}: {str(e)}")
+        except ET.ParseError as e:
+            logging.error(f"Error parsing feed content for {source_name}: {str(e)}")
+        finally:
+            if not completed:
+                # A parser left mid-document or after an error can't be reused
+                self._parsers.xml = None
         
         return articles
     
+    def _read_items(self, parser, articles, source_name):
+        """Turn the items the parser has finished so far into articles, then discard them."""
+        for _, element in parser.read_events():
+            if element.tag == 'item':
+                articles.append(self._rss_item_article(element, source_name))
+            else:
+                articles.append(self._atom_entry_article(element, source_name))
+            
+            # Drop the finished item and any earlier siblings
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+    
     def _safe_find_text(self, element, tag):
         """Safely extract text from an XML element."""
         found = element.find(tag)
         return found.text if found is not None else ''
     
+    def _rss_item_article(self, item, source_name):
+        """Build an article dictionary from an RSS <item> element."""
+        fields = self._child_texts(item)
+        return {
+            'title': fields.get('title', ''),
+            'description': self._clean_description(fields.get('description', '')),
+            'link': fields.get('link', ''),
+            'date': self._parse_date(fields.get('pubDate', '')),
+            'source': source_name
+        }
+    
+    def _atom_entry_article(self, entry, source_name):
+        """Build an article dictionary from an Atom <entry> element."""
+        link = entry.find('.//{*}link')
+        return {
+            'title': self._safe_find_text(entry, '{*}title'),
+            'description': self._clean_description(self._safe_find_text(entry, '{*}summary')),
+            'link': link.get('href') if link is not None else '',
+            'date': self._parse_date(self._safe_find_text(entry, '{*}updated')),
+            'source': source_name
+        }
+    
+    def _child_texts(self, element):
+        """Collect the text of an XML element's children by tag in a single pass."""
+        texts = {}
+        for child in element:
+            # Keep the first occurrence of each tag, like element.find()
+            if child.tag not in texts:
+                texts[child.tag] = child.text
+        return texts
+    
     def _clean_description(self, description):
         """Clean HTML from description and limit length."""
         if not description:
             return ''
             
-        # Use BeautifulSoup to remove HTML tags
-        soup = BeautifulSoup(description, 'html.parser')
-        text = soup.get_text(separator=' ', strip=True)
+        # Strip simple markup with a regex; RSS descriptions rarely need a full parser
+        text = ' '.join(html.unescape(TAG_RE.sub(' ', description)).split())
+        
+        # Fall back to BeautifulSoup (lxml backend) for scripts, styles or leftover markup
+        lowered = description.lower()
+        if '<script' in lowered or '<style' in lowered or '<' in text or '>' in text:
+            soup = BeautifulSoup(description, 'lxml')
+            text = soup.get_text(separator=' ', strip=True)
         
         # Limit description length
         max_length = 200
@@ -184,26 +276,7 @@ class NewsScraper:
             return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             
         try:
-            # Try various date formats commonly found in RSS feeds
-            formats = [
-                '%a, %d %b %Y %H:%M:%S %z',  # RFC 822: Wed, 02 Oct 2002 13:00:00 GMT
-                '%a, %d %b %Y %H:%M:%S %Z',  # Wed, 02 Oct 2002 13:00:00 GMT
-                '%Y-%m-%dT%H:%M:%S%z',       # ISO 8601: 2002-10-02T13:00:00Z
-                '%Y-%m-%dT%H:%M:%SZ',        # 2002-10-02T13:00:00Z
-                '%Y-%m-%d %H:%M:%S',         # 2002-10-02 13:00:00
-                '%Y-%m-%d',                  # 2002-10-02
-            ]
-            
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(date_str, fmt)
-                    return dt.strftime('%Y-%m-%d %H:%M:%S')
-                except ValueError:
-                    continue
-                    
-            # If none of the formats match, return the original string
-            return date_str
-            
+            return _format_date(date_str)
         except Exception:
             return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     
@@ -213,6 +286,4 @@ class NewsScraper:
     
     def get_sources_for_category(self, category):
         """Get available sources for a specific category."""
-        if category in self.sources:
-            return [source["name"] for source in self.sources[category]]
-        return []
\ No newline at end of file
+        return self._source_names.get(category, ())
\ No newline at end of file
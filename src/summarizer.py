@@ -2,11 +2,17 @@
 Module for summarizing news articles using Claude 3 Haiku API.
 """
 import os
+import time
 import logging
 import requests
 import json
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from src.http_session import create_session
 
 # Load environment variables
 load_dotenv()
@@ -20,6 +26,34 @@ except ImportError:
     class APIError(Exception): pass
     class APIConnectionError(Exception): pass
 
+# Prefer orjson for faster JSON encoding and decoding when it's installed
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj): return json.dumps(obj).encode('utf-8')
+    json_loads = json.loads
+
+# Only advertise brotli when urllib3 has a decoder for it, otherwise the response can't be decoded
+if importlib.util.find_spec('brotli') or importlib.util.find_spec('brotlicffi'):
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+else:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# Maximum number of bytes read from an article page
+MAX_ARTICLE_BYTES = 1_500_000
+
+# Tags that hold article text; only these are built when parsing an article page
+CONTENT_TAGS = ['p', 'h1', 'h2', 'h3', 'article', 'section']
+# Page chrome and scripts, removed along with everything nested inside them
+EXCLUDED_TAGS = ["script", "style", "nav", "footer", "header", "aside", "iframe"]
+# Build the excluded containers too so paragraphs inside them can be discarded
+CONTENT_STRAINER = SoupStrainer(CONTENT_TAGS + EXCLUDED_TAGS)
+
+class SummarizationError(Exception):
+    """Raised when the Claude API fails to produce a summary."""
+
 class ArticleSummarizer:
     """Class to handle article summarization using Claude 3 Haiku."""
     
@@ -38,8 +72,28 @@ class ArticleSummarizer:
         self.client_initialized = bool(self.api_key)
         self.max_tokens = 1000
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': ACCEPT_ENCODING
+        }
+        # Shared session so repeated calls to the same hosts reuse connections
+        self.session = create_session()
+        
+        # Headers and request fields for direct API calls, identical for every request
+        self._api_headers = {
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json"
         }
+        # Ask for the response as server-sent events
+        self._request_template = {
+            "model": "claude-3-haiku-20240307",
+            "max_tokens": self.max_tokens,
+            "stream": True
+        }
+        
+        # Remember finished summaries and downloaded article text by URL
+        self._summary_cache = {}
+        self._cached_article_text = lru_cache(maxsize=128)(self._download_article_text)
     
     def summarize(self, article_data):
         """
@@ -56,101 +110,153 @@ class ArticleSummarizer:
             return {**article_data, 'summary': "Cannot summarize: Claude API key not set."}
         
         try:
-            # Fetch the full article content
-            content = self.fetch_article_content(article_data['link'])
+            summary = ''.join(self.summarize_stream(article_data))
             
-            # If content is too short, it's likely we failed to extract it properly
-            if len(content) < 100:
-                content = article_data.get('description', 'No content available.')
+            if summary:
+                return {**article_data, 'summary': summary}
+            else:
+                error_msg = "No content in response"
+                logging.error(error_msg)
+                return {**article_data, 'summary': f"Error generating summary: {error_msg}"}
                 
-            # Create the prompt for Claude
-            prompt = f"""
-            Please summarize the following news article in 3-4 concise paragraphs. Maintain the factual accuracy and important details.
+        except SummarizationError as e:
+            error_msg = str(e)
+            logging.error(error_msg)
+            return {**article_data, 'summary': f"Error generating summary: {error_msg}"}
+        except Exception as e:
+            error_msg = f"Error summarizing article: {str(e)}"
+            logging.error(error_msg)
+            return {**article_data, 'summary': f"Error generating summary: {error_msg}"}
+    
+    def summarize_stream(self, article_data):
+        """
+        Summarize an article, yielding the summary text as Claude generates it.
+        
+        Args:
+            article_data (dict): A dictionary containing article information
+                                 (title, link, description, etc.)
             
-            Title: {article_data['title']}
-            Source: {article_data['source']}
+        Yields:
+            str: Successive chunks of the summary text
             
-            Article Content:
-            {content}
+        Raises:
+            SummarizationError: If the API key is missing or the API request fails
+        """
+        if not self.client_initialized:
+            raise SummarizationError("Claude API key not set.")
+        
+        cached_summary = self._summary_cache.get(article_data['link'])
+        if cached_summary is not None:
+            yield cached_summary
+            return
+        
+        # Fetch the full article content
+        content = self.fetch_article_content(article_data['link'])
+        
+        # If content is too short, it's likely we failed to extract it properly
+        if len(content) < 100:
+            content = article_data.get('description', 'No content available.')
             
-            Summary:
-            """
+        # Create the prompt for Claude
+        prompt = f"""
+        Please summarize the following news article in 3-4 concise paragraphs. Maintain the factual accuracy and important details.
+        
+        Title: {article_data['title']}
+        Source: {article_data['source']}
+        
+        Article Content:
+        {content}
+        
+        Summary:
+        """
+        
+        # Make direct API call to Claude
+        logging.info("Making direct API call to Claude...")
+        
+        # Request body, only the messages change between calls
+        request_data = {
+            **self._request_template,
+            "messages": [
+                {"role": "user", "content": prompt}
+            ]
+        }
+        
+        chunks = []
+        with self._post_message(self._api_headers, request_data, stream=True) as response:
+            logging.info(f"API response status: {response.status_code}")
             
-            # Make direct API call to Claude
-            logging.info("Making direct API call to Claude...")
+            if response.status_code != 200:
+                error_detail = response.text[:200] if hasattr(response, 'text') else "Unknown error"
+                raise SummarizationError(f"API request failed: {response.status_code} - {error_detail}")
             
-            # Define headers for direct API call
-            headers = {
-                "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json"
-            }
+            # Each event arrives as a "data: {...}" line; text comes in content_block_delta events
+            for line in response.iter_lines():
+                if not line.startswith(b'data:'):
+                    continue
+                event = json_loads(line[5:])
+                
+                if event.get('type') == 'content_block_delta':
+                    text = event['delta'].get('text', '')
+                    if text:
+                        chunks.append(text)
+                        yield text
+                elif event.get('type') == 'error':
+                    raise SummarizationError(f"API stream error: {event['error'].get('message', 'Unknown error')}")
+        
+        if chunks:
+            logging.info(f"Successfully generated summary via direct API call")
+            self._summary_cache[article_data['link']] = ''.join(chunks)
+    
+    def summarize_many(self, articles, max_workers=8):
+        """
+        Summarize several articles concurrently.
+        
+        Args:
+            articles (list): List of article dictionaries
+            max_workers (int): Maximum number of concurrent summarizations
             
-            # Request body
-            request_data = {
-                "model": "claude-3-haiku-20240307",
-                "max_tokens": self.max_tokens,
-                "messages": [
-                    {"role": "user", "content": prompt}
-                ]
-            }
+        Returns:
+            list: The articles with added 'summary' fields, in the same order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.summarize, articles))
+    
+    def _post_message(self, headers, request_data, stream=False, max_retries=3):
+        """
+        Send a request to the Claude messages API, backing off when rate limited.
+        
+        Args:
+            headers (dict): Request headers
+            request_data (dict): Request body
+            stream (bool): Whether to stream the response body
+            max_retries (int): Maximum number of retries after a 429 response
             
-            # Make direct API call
-            response = requests.post(
+        Returns:
+            requests.Response: The final API response
+        """
+        # Serialize once, even if the request has to be retried
+        body = json_dumps(request_data)
+        
+        for attempt in range(max_retries + 1):
+            response = self.session.post(
                 "https://api.anthropic.com/v1/messages",
                 headers=headers,
-                json=request_data,
+                data=body,
+                stream=stream,
                 timeout=15
             )
             
-            logging.info(f"API response status: {response.status_code}")
+            if response.status_code != 429 or attempt == max_retries:
+                return response
+            response.close()
             
-            # If successful, parse and return the response
-            if response.status_code == 200:
-                response_data = response.json()
-                if "content" in response_data and len(response_data["content"]) > 0:
-                    summary = response_data["content"][0]["text"]
-                    logging.info(f"Successfully generated summary via direct API call")
-                    return {**article_data, 'summary': summary}
-                else:
-                    error_msg = "No content in response"
-                    logging.error(error_msg)
-                    return {**article_data, 'summary': f"Error generating summary: {error_msg}"}
-            else:
-                # Try with alternative auth header format
-                logging.info("Trying alternative authentication format...")
-                alt_headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json"
-                }
-                
-                alt_response = requests.post(
-                    "https://api.anthropic.com/v1/messages",
-                    headers=alt_headers,
-                    json=request_data,
-                    timeout=15
-                )
-                
-                logging.info(f"Alternative API response status: {alt_response.status_code}")
-                
-                if alt_response.status_code == 200:
-                    alt_response_data = alt_response.json()
-                    if "content" in alt_response_data and len(alt_response_data["content"]) > 0:
-                        summary = alt_response_data["content"][0]["text"]
-                        logging.info(f"Successfully generated summary via alternative auth method")
-                        return {**article_data, 'summary': summary}
-                
-                # Both attempts failed
-                error_detail = response.text[:200] if hasattr(response, 'text') else "Unknown error"
-                error_msg = f"API request failed: {response.status_code} - {error_detail}"
-                logging.error(error_msg)
-                return {**article_data, 'summary': f"Error generating summary: {error_msg}"}
-                
-        except Exception as e:
-            error_msg = f"Error summarizing article: {str(e)}"
-            logging.error(error_msg)
-            return {**article_data, 'summary': f"Error generating summary: {error_msg}"}
+            # Wait as long as the API asks, or back off exponentially if it doesn't say
+            try:
+                delay = float(response.headers.get('retry-after', 2 ** attempt))
+            except ValueError:
+                delay = 2 ** attempt
+            logging.warning(f"Rate limited by Claude API, retrying in {delay} seconds...")
+            time.sleep(delay)
     
     def fetch_article_content(self, url):
         """
@@ -163,32 +269,50 @@ class ArticleSummarizer:
             str: The text content of the article
         """
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
-            
-            # Parse the HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
+            return self._cached_article_text(url)
             
-            # Remove script and style elements
-            for script in soup(["script", "style", "nav", "footer", "header", "aside", "iframe"]):
-                script.extract()
-            
-            # Extract text from paragraphs and headings
-            paragraphs = soup.find_all(['p', 'h1', 'h2', 'h3', 'article', 'section', 'div.content'])
-            
-            # If no paragraphs found, try to extract text from the body
-            if not paragraphs:
-                return soup.get_text(separator='\n\n', strip=True)
-            
-            # Combine paragraphs
-            content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs])
-            
-            return content
-            
-        except requests.RequestException as e:
+        except (requests.RequestException, Urllib3HTTPError) as e:
+            # The body is read from the raw urllib3 stream, so its errors aren't wrapped by requests
             logging.error(f"Error fetching article content: {str(e)}")
             return f"Error fetching article content: {str(e)}"
     
+    def _download_article_text(self, url):
+        """
+        Download an article and extract its text, raising on request errors.
+        
+        Args:
+            url (str): The URL of the article to fetch
+            
+        Returns:
+            str: The text content of the article
+        """
+        # Stream the body so oversized pages can be cut off instead of downloaded whole
+        with self.session.get(url, headers=self.headers, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            html = response.raw.read(MAX_ARTICLE_BYTES, decode_content=True)
+        
+        # Parse only the content tags with the C-based lxml parser, skipping the rest of the page
+        soup = BeautifulSoup(html, 'lxml', parse_only=CONTENT_STRAINER)
+        
+        # Remove script, style and page chrome elements along with their contents
+        for script in soup(EXCLUDED_TAGS):
+            script.extract()
+        
+        # Extract text from paragraphs and headings
+        paragraphs = soup.find_all(CONTENT_TAGS)
+        
+        # If no paragraphs found, try to extract text from the whole body
+        if not paragraphs:
+            soup = BeautifulSoup(html, 'lxml')
+            for script in soup(EXCLUDED_TAGS):
+                script.extract()
+            return soup.get_text(separator='\n\n', strip=True)
+        
+        # Combine paragraphs
+        content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs])
+        
+        return content
+    
     def is_api_key_set(self):
         """Check if the API key is set."""
         return bool(self.api_key)
\ No newline at end of file